@@ -1,14 +1,121 @@
 import re
 import os
-from typing import Dict, List, Union, Any
+import asyncio
+import copy
+import hashlib
+from collections import OrderedDict
+from typing import Dict, List, Tuple, Union, Any, Optional
 from pathlib import Path
+import httpx
+import tiktoken
 from langchain_openai import ChatOpenAI
+from langchain_core.globals import set_llm_cache
 from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from langchain_core.prompts import PromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
+from langchain_community.cache import SQLiteCache
 from models import JDAnalysisResult
 from utils import extract_text_from_pdf, preprocess_text
 
+# Process-wide flag so the LLM cache is only installed once
+_llm_cache_configured = False
+
+# Pooled HTTP clients shared by every analyzer instance, so concurrent
+# OpenAI calls reuse keepalive connections instead of re-handshaking TLS.
+# The async twin covers astream/abatch, which otherwise fall back to a
+# default per-instance client and get no cross-instance reuse.
+_OPENAI_HTTP = httpx.Client(
+    limits=httpx.Limits(max_keepalive_connections=20)
+)
+_OPENAI_AHTTP = httpx.AsyncClient(
+    limits=httpx.Limits(max_keepalive_connections=20)
+)
+
+# In-process result cache shared across analyzer instances. Unlike the LLM
+# cache this also skips preprocessing, prompt formatting, parsing and
+# post-processing on duplicate inputs. Keyed by (model_name, JD hash) with
+# LRU eviction via OrderedDict.
+_ANALYSIS_CACHE: "OrderedDict[Tuple[str, bytes], Dict[str, Any]]" = OrderedDict()
+_ANALYSIS_CACHE_MAX = 1024
+
+
+def _jd_cache_key(model_name: str, jd_text: str) -> Tuple[str, bytes]:
+    """
+    Build the analysis-cache key for a preprocessed JD.
+    """
+    digest = hashlib.blake2b(jd_text.encode(), digest_size=16).digest()
+    return (model_name, digest)
+
+
+def _analysis_cache_get(key: Tuple[str, bytes]) -> Optional[Dict[str, Any]]:
+    """
+    Return a deep copy of the cached result for key, or None on miss.
+    """
+    result = _ANALYSIS_CACHE.get(key)
+    if result is None:
+        return None
+    _ANALYSIS_CACHE.move_to_end(key)
+    # Copy so callers mutating the result don't poison the cache
+    return copy.deepcopy(result)
+
+
+def _analysis_cache_put(key: Tuple[str, bytes], result: Dict[str, Any]) -> None:
+    """
+    Store an analysis result, evicting the least recently used entry.
+    """
+    _ANALYSIS_CACHE[key] = copy.deepcopy(result)
+    _ANALYSIS_CACHE.move_to_end(key)
+    if len(_ANALYSIS_CACHE) > _ANALYSIS_CACHE_MAX:
+        _ANALYSIS_CACHE.popitem(last=False)
+
+# Matches a fully streamed string field inside a partial JSON response
+_PARTIAL_FIELD_RE = re.compile(r'"(title|location)"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+# Skill dictionary for the rule-based fallback
+_SKILL_KEYWORDS = [
+    "python", "java", "javascript", "react", "angular", "vue", "node", "django", "flask",
+    "sql", "mongodb", "postgresql", "mysql", "aws", "docker", "kubernetes", "git",
+    "machine learning", "ai", "data science", "analytics", "tableau", "powerbi"
+]
+
+# One compiled alternation finds every keyword in a single pass over the JD,
+# instead of one substring scan per keyword. Longest-first so multi-word
+# skills win over their substrings ("machine learning" vs "ai").
+_SKILL_RE = re.compile(
+    "|".join(sorted(map(re.escape, _SKILL_KEYWORDS), key=len, reverse=True))
+)
+
+_EXP_RE = re.compile(r'(\d+)\s*(?:\+|\-|\s)*\s*years?\s*(?:of\s*)?experience')
+
+# JDs under this many tokens are routed to the cheaper/faster model
+_SHORT_JD_TOKEN_LIMIT = 2000
+
+# Oversized JDs are cut down to their requirement-bearing sentences,
+# hard-capped at this many prompt tokens
+_JD_TOKEN_CAP = 1500
+
+_RELEVANT_SECTION_RE = re.compile(
+    r'(?i)requirements?|responsibilit|qualifications?|experience|skills?'
+)
+
+# Small model adequate for short, well-structured JDs
+_SHORT_JD_MODEL = "gpt-4o-mini"
+
+
+def _configure_llm_cache(database_path: str = ".jd_cache.db") -> None:
+    """
+    Install a global SQLite-backed LLM cache (no-op if already installed)
+
+    Identical prompts then return from the local cache instead of
+    re-issuing an OpenAI call, which is common on pipeline re-runs.
+
+    Args:
+        database_path (str): Path to the SQLite cache database
+    """
+    global _llm_cache_configured
+    if not _llm_cache_configured:
+        set_llm_cache(SQLiteCache(database_path=database_path))
+        _llm_cache_configured = True
+
 
 class JDAnalyzer:
     """
@@ -23,46 +130,53 @@ class JDAnalyzer:
         Args:
             model_name (str): LLM model to use (default: gpt-3.5-turbo)
         """
-        self.llm = ChatOpenAI(
+        # Cache identical prompts so repeated analyses skip the API entirely
+        _configure_llm_cache()
+
+        self.model_name = model_name
+
+        llm_kwargs = dict(
             openai_api_key=os.getenv("OPENAI_API_KEY"),
-            model_name=model_name,
-            temperature=0.1  # Low temperature for consistent extraction
+            temperature=0,  # Deterministic extraction, also enables exact cache hits
+            streaming=True,  # Stream tokens so partial fields surface early
+            max_tokens=600,  # The structured output never needs more
+            max_retries=5,  # Built-in exponential backoff on 429/503
+            http_client=_OPENAI_HTTP,
+            http_async_client=_OPENAI_AHTTP,
+            model_kwargs={"response_format": {"type": "json_object"}}
         )
+
+        # Route short JDs to the smaller model; long ones get the configured model
+        self._router = {
+            "short": ChatOpenAI(model_name=_SHORT_JD_MODEL, **llm_kwargs),
+            "long": ChatOpenAI(model_name=model_name, **llm_kwargs),
+        }
+        self.llm = self._router["long"]
+
+        try:
+            self._encoding = tiktoken.encoding_for_model(_SHORT_JD_MODEL)
+        except KeyError:
+            self._encoding = tiktoken.get_encoding("cl100k_base")
         
-        # Setup output parser
-        self.output_parser = PydanticOutputParser(pydantic_object=JDAnalysisResult)
-        
-        # Create the analysis prompt
+        # Compact prompt: native JSON mode replaces the verbose output-parser
+        # format instructions and the "return only JSON" preamble
         self.analysis_prompt = PromptTemplate(
             template="""
-You are an expert HR analyst. Analyze the following job description and extract the required information.
+Analyze the job description and return a JSON object with exactly these keys:
+title (string), minimum_degree ("None"|"Diploma"|"Bachelor"|"Master"|"PhD"),
+location (string, city/state/country or "Remote"), skills (array of strings),
+experience (integer, minimum years, 0 if entry-level),
+search_keywords (array of strings for LinkedIn candidate search),
+workright_requirement (string, "None" if not specified).
+
+Rules: map certificates to "Diploma"; for experience ranges use the minimum;
+skills include technical and soft skills, languages, frameworks and tools;
+search_keywords include title variations, key technologies and industry terms.
 
 Job Description:
 {job_description}
-
-Please extract the following information and return it in the specified JSON format:
-
-1. **title**: The main job title/position name
-2. **minimum_degree**: Education requirement (must be one of: "None", "Diploma", "Bachelor", "Master", "PhD")
-3. **location**: Job location (city, state, country, or "Remote")
-4. **skills**: List of technical skills, tools, technologies, and competencies required
-5. **experience**: Minimum years of experience required (as integer, 0 if entry-level)
-6. **search_keywords**: List of keywords that would be useful for searching candidates on LinkedIn
-7. **workright_requirement**: Work authorization requirements ("None" if not specified, otherwise brief description)
-
-Guidelines:
-- For minimum_degree: If no specific degree is mentioned, use "None". Map certificates/diplomas to "Diploma".
-- For experience: Extract numerical years. If range given (e.g., "3-5 years"), use the minimum.
-- For skills: Include both technical and soft skills, programming languages, frameworks, tools.
-- For search_keywords: Include job title variations, key technologies, and industry terms.
-- For workright_requirement: Look for visa, citizenship, or authorization requirements.
-
-{format_instructions}
-
-Return only the JSON object with the extracted information.
 """,
-            input_variables=["job_description"],
-            partial_variables={"format_instructions": self.output_parser.get_format_instructions()}
+            input_variables=["job_description"]
         )
     
     def analyze_jd(self, job_description: Union[str, Path]) -> Dict[str, Any]:
@@ -76,6 +190,102 @@ Return only the JSON object with the extracted information.
         Returns:
             Dict[str, Any]: Structured analysis results
         """
+        jd_text = self._load_jd_text(job_description)
+
+        # Duplicate JDs skip the whole format/call/parse path
+        cache_key = _jd_cache_key(self.model_name, jd_text)
+        cached = _analysis_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            messages = self._build_messages(jd_text)
+
+            response = self._select_llm(jd_text).invoke(messages)
+
+            # Parse the response (native JSON mode guarantees a JSON object)
+            parsed_result = JDAnalysisResult.model_validate_json(response.content)
+
+            # Convert to dictionary
+            result_dict = parsed_result.dict()
+
+            # Post-process and validate
+            result_dict = self._post_process_results(result_dict)
+
+            _analysis_cache_put(cache_key, result_dict)
+            return result_dict
+            
+        except Exception as e:
+            # Fallback: try to parse manually if LLM parsing fails
+            print(f"LLM parsing failed: {str(e)}")
+            return self._fallback_analysis(jd_text)
+
+    async def aanalyze_jd(
+        self,
+        job_description: Union[str, Path],
+        on_partial=None
+    ) -> Dict[str, Any]:
+        """
+        Analyze a job description with streaming token accumulation
+
+        The full JSON is still required before parsing, but streaming lets
+        callers react to early fields: on_partial(field, value) fires as soon
+        as the title/location values are complete in the partial response,
+        so e.g. the profile search can start before analysis finishes.
+
+        Args:
+            job_description (Union[str, Path]): Either a string containing the JD
+                                              or a Path to a PDF file
+            on_partial (callable, optional): Called once per early field with
+                                             (field_name, value)
+
+        Returns:
+            Dict[str, Any]: Structured analysis results
+        """
+        jd_text = await asyncio.to_thread(self._load_jd_text, job_description)
+
+        # Duplicate JDs skip the whole format/call/parse path
+        cache_key = _jd_cache_key(self.model_name, jd_text)
+        cached = _analysis_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            messages = self._build_messages(jd_text)
+
+            buffer = ""
+            emitted = set()
+            async for chunk in self._select_llm(jd_text).astream(messages):
+                buffer += chunk.content
+                if on_partial is None:
+                    continue
+                for match in _PARTIAL_FIELD_RE.finditer(buffer):
+                    field, value = match.group(1), match.group(2)
+                    if field not in emitted:
+                        emitted.add(field)
+                        on_partial(field, value)
+
+            parsed_result = JDAnalysisResult.model_validate_json(buffer)
+            result_dict = self._post_process_results(parsed_result.dict())
+            _analysis_cache_put(cache_key, result_dict)
+            return result_dict
+
+        except Exception as e:
+            # Fallback: try to parse manually if LLM parsing fails
+            print(f"LLM parsing failed: {str(e)}")
+            return self._fallback_analysis(jd_text)
+
+    def _load_jd_text(self, job_description: Union[str, Path]) -> str:
+        """
+        Resolve a JD input (string, text file or PDF) into preprocessed text
+
+        Args:
+            job_description (Union[str, Path]): Either a string containing the JD
+                                              or a path to a txt/PDF file
+
+        Returns:
+            str: Cleaned job description text
+        """
         # Handle different input types
         if isinstance(job_description, (str, Path)) and Path(job_description).exists():
             # It's a file path
@@ -88,41 +298,87 @@ Return only the JSON object with the extracted information.
         else:
             # It's a string
             jd_text = str(job_description)
-        
+
         # Preprocess the text
         jd_text = preprocess_text(jd_text)
-        
+
         if not jd_text:
             raise ValueError("No text content found in job description")
-        
-        try:
-            # Create the prompt
-            formatted_prompt = self.analysis_prompt.format(job_description=jd_text)
-            
-            # Get LLM response
-            messages = [
-                SystemMessage(content="You are an expert HR analyst specializing in job description analysis."),
-                HumanMessage(content=formatted_prompt)
-            ]
-            
-            response = self.llm.invoke(messages)
-            
-            # Parse the response
-            parsed_result = self.output_parser.parse(response.content)
-            
-            # Convert to dictionary
-            result_dict = parsed_result.dict()
-            
-            # Post-process and validate
-            result_dict = self._post_process_results(result_dict)
-            
-            return result_dict
-            
-        except Exception as e:
-            # Fallback: try to parse manually if LLM parsing fails
-            print(f"LLM parsing failed: {str(e)}")
-            return self._fallback_analysis(jd_text)
-    
+
+        return jd_text
+
+    def _route_label(self, jd_text: str) -> str:
+        """
+        Classify a JD as "short" or "long" by estimated token count
+
+        Args:
+            jd_text (str): Preprocessed job description text
+
+        Returns:
+            str: Router key for the model to use
+        """
+        if len(self._encoding.encode(jd_text)) < _SHORT_JD_TOKEN_LIMIT:
+            return "short"
+        return "long"
+
+    def _select_llm(self, jd_text: str) -> ChatOpenAI:
+        """
+        Pick the smallest adequate model for this JD
+
+        Args:
+            jd_text (str): Preprocessed job description text
+
+        Returns:
+            ChatOpenAI: The routed model instance
+        """
+        return self._router[self._route_label(jd_text)]
+
+    def _truncate_jd(self, jd_text: str) -> str:
+        """
+        Cap oversized JDs at _JD_TOKEN_CAP prompt tokens
+
+        Oversized JDs are first reduced to their requirement-bearing
+        sentences (requirements, responsibilities, qualifications, ...)
+        before being hard-capped, so the cut falls on boilerplate.
+
+        Args:
+            jd_text (str): Preprocessed job description text
+
+        Returns:
+            str: The JD text, truncated if necessary
+        """
+        tokens = self._encoding.encode(jd_text)
+        if len(tokens) <= _JD_TOKEN_CAP:
+            return jd_text
+
+        sentences = jd_text.split('. ')
+        relevant = [s for s in sentences if _RELEVANT_SECTION_RE.search(s)]
+        if relevant:
+            jd_text = '. '.join(relevant)
+            tokens = self._encoding.encode(jd_text)
+
+        if len(tokens) > _JD_TOKEN_CAP:
+            jd_text = self._encoding.decode(tokens[:_JD_TOKEN_CAP])
+        return jd_text
+
+    def _build_messages(self, jd_text: str) -> List[BaseMessage]:
+        """
+        Build the chat messages for a single JD analysis call
+
+        Args:
+            jd_text (str): Preprocessed job description text
+
+        Returns:
+            List[BaseMessage]: System + human messages for the LLM
+        """
+        formatted_prompt = self.analysis_prompt.format(
+            job_description=self._truncate_jd(jd_text)
+        )
+        return [
+            SystemMessage(content="You are an expert HR analyst specializing in job description analysis."),
+            HumanMessage(content=formatted_prompt)
+        ]
+
     def _post_process_results(self, results: Dict[str, Any]) -> Dict[str, Any]:
         """
         Post-process and validate results
@@ -133,13 +389,13 @@ Return only the JSON object with the extracted information.
         Returns:
             Dict[str, Any]: Processed and validated results
         """
-        # Ensure skills are unique and non-empty
+        # Dedup skills/keywords in one pass via dict insertion order, keeping
+        # the LLM's priority ranking intact (downstream search uses skills[:3])
         if 'skills' in results:
-            results['skills'] = list(set([skill.strip() for skill in results['skills'] if skill.strip()]))
-        
-        # Ensure search_keywords are unique and non-empty
+            results['skills'] = list({s.strip(): None for s in results['skills'] if s.strip()})
+
         if 'search_keywords' in results:
-            results['search_keywords'] = list(set([kw.strip() for kw in results['search_keywords'] if kw.strip()]))
+            results['search_keywords'] = list({kw.strip(): None for kw in results['search_keywords'] if kw.strip()})
         
         # Validate experience is non-negative
         if 'experience' in results:
@@ -176,40 +432,94 @@ Return only the JSON object with the extracted information.
             "workright_requirement": "None"
         }
         
-        # Simple keyword extraction for skills
-        skill_keywords = [
-            "python", "java", "javascript", "react", "angular", "vue", "node", "django", "flask",
-            "sql", "mongodb", "postgresql", "mysql", "aws", "docker", "kubernetes", "git",
-            "machine learning", "ai", "data science", "analytics", "tableau", "powerbi"
-        ]
-        
+        # Single-pass keyword extraction for skills
         jd_lower = jd_text.lower()
-        found_skills = [skill for skill in skill_keywords if skill in jd_lower]
+        found_skills = list(dict.fromkeys(_SKILL_RE.findall(jd_lower)))
         results["skills"] = found_skills[:10]  # Limit to 10 skills
-        
+
         # Extract experience years
-        exp_match = re.search(r'(\d+)\s*(?:\+|\-|\s)*\s*years?\s*(?:of\s*)?experience', jd_lower)
+        exp_match = _EXP_RE.search(jd_lower)
         if exp_match:
             results["experience"] = int(exp_match.group(1))
         
         return results
     
-    def batch_analyze(self, job_descriptions: List[Union[str, Path]]) -> List[Dict[str, Any]]:
+    async def abatch_analyze(
+        self,
+        job_descriptions: List[Union[str, Path]],
+        max_concurrency: int = 10
+    ) -> List[Optional[Dict[str, Any]]]:
         """
-        Analyze multiple job descriptions
-        
+        Analyze multiple job descriptions concurrently via llm.abatch
+
+        All LLM calls are dispatched in one concurrent wave (bounded by
+        max_concurrency) instead of one blocking round-trip per JD.
+
         Args:
             job_descriptions (List[Union[str, Path]]): List of JDs or file paths
-            
+            max_concurrency (int): Max concurrent LLM requests
+
         Returns:
-            List[Dict[str, Any]]: List of analysis results
+            List[Optional[Dict[str, Any]]]: Analysis results, None where a JD could not be loaded
         """
-        results = []
+        # Resolve file paths / PDF extraction off the event loop
+        jd_texts: List[Optional[str]] = []
         for jd in job_descriptions:
             try:
-                result = self.analyze_jd(jd)
-                results.append(result)
+                jd_texts.append(await asyncio.to_thread(self._load_jd_text, jd))
             except Exception as e:
-                print(f"Error analyzing JD: {str(e)}")
+                print(f"Error loading JD: {str(e)}")
+                jd_texts.append(None)
+
+        # Route each JD to its model, then dispatch one batch per model
+        grouped: Dict[str, List[int]] = {"short": [], "long": []}
+        for index, text in enumerate(jd_texts):
+            if text is not None:
+                grouped[self._route_label(text)].append(index)
+
+        async def run_group(label: str, indices: List[int]):
+            messages_list = [self._build_messages(jd_texts[i]) for i in indices]
+            # return_exceptions keeps one exhausted-retry/transport failure
+            # from sinking the whole batch; failed entries degrade per JD below
+            responses = await self._router[label].abatch(
+                messages_list,
+                config={"max_concurrency": max_concurrency},
+                return_exceptions=True,
+            )
+            return list(zip(indices, responses))
+
+        group_results = await asyncio.gather(
+            *[run_group(label, indices) for label, indices in grouped.items() if indices]
+        )
+        responses_by_index = dict(pair for group in group_results for pair in group)
+
+        # Re-align responses with the original JD order and parse each one
+        results: List[Optional[Dict[str, Any]]] = []
+        for index, text in enumerate(jd_texts):
+            if text is None:
                 results.append(None)
-        return results
\ No newline at end of file
+                continue
+            response = responses_by_index[index]
+            if isinstance(response, Exception):
+                print(f"LLM call failed: {str(response)}")
+                results.append(self._fallback_analysis(text))
+                continue
+            try:
+                parsed_result = JDAnalysisResult.model_validate_json(response.content)
+                results.append(self._post_process_results(parsed_result.dict()))
+            except Exception as e:
+                print(f"LLM parsing failed: {str(e)}")
+                results.append(self._fallback_analysis(text))
+        return results
+
+    def batch_analyze(self, job_descriptions: List[Union[str, Path]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Analyze multiple job descriptions
+
+        Args:
+            job_descriptions (List[Union[str, Path]]): List of JDs or file paths
+
+        Returns:
+            List[Optional[Dict[str, Any]]]: List of analysis results
+        """
+        return asyncio.run(self.abatch_analyze(job_descriptions))
\ No newline at end of file
@@ -1,7 +1,14 @@
 import re
 from typing import Union
 from pathlib import Path
-import PyPDF2
+import pypdf
+
+# Compiled once at import; preprocess_text runs per JD, thousands of times
+# in batch mode. The single \s+ collapse also subsumes the old \n+ pass.
+# Boilerplate phrases are \s+-tolerant because PDF extraction routinely
+# splits them across line breaks ("Apply\nnow")
+_WS = re.compile(r'\s+')
+_UNWANTED = re.compile(r'(?i)Apply\s+now|Submit\s+resume|EOE|Equal\s+Opportunity')
 
 def extract_text_from_pdf(pdf_path: Union[str, Path]) -> str:
     """
@@ -15,14 +22,12 @@ def extract_text_from_pdf(pdf_path: Union[str, Path]) -> str:
     """
     try:
         with open(pdf_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            text = ""
-            
-            for page_num in range(len(pdf_reader.pages)):
-                page = pdf_reader.pages[page_num]
-                text += page.extract_text() + "\n"
-            
-            return text.strip()
+            pdf_reader = pypdf.PdfReader(file, strict=False)
+            # Generator join keeps total allocation linear in document size,
+            # unlike += concatenation which reallocates the growing string
+            return "\n".join(
+                (page.extract_text() or "") for page in pdf_reader.pages
+            ).strip()
     except Exception as e:
         raise Exception(f"Error extracting text from PDF: {str(e)}")
 
@@ -36,11 +41,6 @@ def preprocess_text(text: str) -> str:
     Returns:
         str: Cleaned text
     """
-    # Remove extra whitespace and normalize
-    text = re.sub(r'\s+', ' ', text)
-    text = re.sub(r'\n+', '\n', text)
-    
-    # Remove common unwanted patterns
-    text = re.sub(r'(Apply now|Submit resume|EOE|Equal Opportunity)', '', text, flags=re.IGNORECASE)
-    
-    return text.strip() 
\ No newline at end of file
+    # Collapse all whitespace in one pass, then strip unwanted boilerplate
+    # (same order as before the patterns were hoisted)
+    return _UNWANTED.sub('', _WS.sub(' ', text)).strip()
\ No newline at end of file
@@ -1,50 +1,140 @@
 import os
+import asyncio
+import threading
 from typing import Union, Dict, Any, List
 from dotenv import load_dotenv
 import json
 
 from jd_understanding_agent.jd_analyzer import JDAnalyzer
-from talent_search_agent.crawler import search_linkedin_profiles
-from profile_analysis_agent.summary_profile import get_linkedin_profile_summary
+from talent_search_agent.crawler import iter_linkedin_profiles
+# LinkedInSession comes via summary_profile so the scraper module is only
+# ever loaded under one name (summary_profile imports it as top-level
+# `scraper`); importing profile_analysis_agent.scraper here as well would
+# load a second copy with its own HTTP client and cookie state
+from profile_analysis_agent.summary_profile import (
+    get_linkedin_profile_summary,
+    LinkedInSession,
+)
 
 load_dotenv('src/profile_analysis_agent/config.env')
 
-def main(
+async def amain(
     job_description: Union[str, os.PathLike],
     model_name: str = "gpt-3.5-turbo",
-    max_profiles: int = 30
+    max_profiles: int = 30,
+    max_concurrent: int = 5
 ) -> Dict[str, Any]:
     """
-    Orchestrate the talent search pipeline:
-    1. Analyze the job description to extract attributes.
-    2. Search LinkedIn for profiles matching those attributes.
-    3. Summarize each found LinkedIn profile.
+    Orchestrate the talent search pipeline as an overlapping DAG:
+    1. Analyze the job description, kicking off a provisional search as
+       soon as title + location stream in.
+    2. Each search pushes its batch of profile URLs onto a queue once it
+       completes.
+    3. A pool of workers summarizes queued profiles while the remaining
+       analysis and the full search are still running.
+
+    Overlap comes from the provisional prefetch and the queue: workers
+    start on the prefetch's URLs before the full search lands, though
+    each search delivers its URLs in one burst rather than one by one.
 
     Args:
         job_description (Union[str, os.PathLike]): Path to a JD file (txt/pdf) or a JD string.
         model_name (str, optional): Name of the OpenAI model to use for JD analysis.
         max_profiles (int, optional): Maximum number of LinkedIn profiles to retrieve.
+        max_concurrent (int, optional): Number of summary workers running at once.
 
     Returns:
         Dict[str, Any]: A mapping from LinkedIn profile URL to its summary dict.
     """
-    # 1. Analyze the JD
     analyzer = JDAnalyzer(model_name=model_name)
-    attributes = analyzer.analyze_jd(job_description)
+    url_queue: asyncio.Queue = asyncio.Queue()
+    results: Dict[str, Any] = {}
+    seen_urls: set = set()
+    # The provisional-prefetch and full searches run in separate threads
+    # and surface near-identical URLs, so the dedup/cap check must be atomic
+    seen_lock = threading.Lock()
+    loop = asyncio.get_running_loop()
 
-    print("\n--- JD Analysis Complete ---")
-    print(json.dumps(attributes, indent=2))
+    def run_search(attributes: Dict[str, Any]):
+        # Stream search results into the queue, skipping already-queued URLs
+        for url in iter_linkedin_profiles(attributes, max_profiles=max_profiles):
+            with seen_lock:
+                if url in seen_urls or len(seen_urls) >= max_profiles:
+                    continue
+                seen_urls.add(url)
+            loop.call_soon_threadsafe(url_queue.put_nowait, url)
 
-    # 2. Search LinkedIn profiles
-    urls: List[str] = search_linkedin_profiles(attributes, max_profiles=max_profiles)
+    async def produce_urls():
+        partial_fields: Dict[str, str] = {}
+        prefetch_tasks: List[asyncio.Task] = []
 
-    # 3. Summarize each profile
-    results: Dict[str, Any] = {}
-    for url in urls:
-        try:
-            summary = get_linkedin_profile_summary(url)
-            results[url] = summary
-        except Exception as e:
-            # Record error per profile
-            results[url] = {"error": str(e)}
-    return results
\ No newline at end of file
+        def on_partial(field: str, value: str):
+            # As soon as the streamed response contains title + location,
+            # kick off a provisional search while analysis is still running
+            partial_fields[field] = value
+            if "title" in partial_fields and "location" in partial_fields and not prefetch_tasks:
+                provisional = {
+                    "title": partial_fields["title"],
+                    "location": partial_fields["location"],
+                }
+                prefetch_tasks.append(
+                    asyncio.create_task(asyncio.to_thread(run_search, provisional))
+                )
+
+        # Stage 1: analyze the JD, surfacing early fields via streaming
+        attributes = await analyzer.aanalyze_jd(job_description, on_partial=on_partial)
+
+        print("\n--- JD Analysis Complete ---")
+        print(json.dumps(attributes, indent=2))
+
+        # Stage 2: run the full search with the complete attributes
+        await asyncio.to_thread(run_search, attributes)
+        if prefetch_tasks:
+            await asyncio.gather(*prefetch_tasks, return_exceptions=True)
+
+        # One sentinel per worker so every worker shuts down
+        for _ in range(max_concurrent):
+            url_queue.put_nowait(None)
+
+    async def summarize_worker(session: LinkedInSession):
+        # Stage 3: consume URLs as they become available
+        while True:
+            url = await url_queue.get()
+            if url is None:
+                break
+            try:
+                results[url] = await asyncio.to_thread(
+                    get_linkedin_profile_summary, url, session
+                )
+            except Exception as e:
+                # Record error per profile
+                results[url] = {"error": str(e)}
+
+    # One logged-in browser session shared by all workers, so the Selenium
+    # fallback pays Chrome startup + login at most once per run
+    with LinkedInSession() as session:
+        producer = asyncio.create_task(produce_urls())
+        workers = [summarize_worker(session) for _ in range(max_concurrent)]
+        await asyncio.gather(producer, *workers)
+    return results
+
+
+def main(
+    job_description: Union[str, os.PathLike],
+    model_name: str = "gpt-3.5-turbo",
+    max_profiles: int = 30
+) -> Dict[str, Any]:
+    """
+    Synchronous entry point for the talent search pipeline.
+
+    Args:
+        job_description (Union[str, os.PathLike]): Path to a JD file (txt/pdf) or a JD string.
+        model_name (str, optional): Name of the OpenAI model to use for JD analysis.
+        max_profiles (int, optional): Maximum number of LinkedIn profiles to retrieve.
+
+    Returns:
+        Dict[str, Any]: A mapping from LinkedIn profile URL to its summary dict.
+    """
+    return asyncio.run(
+        amain(job_description, model_name=model_name, max_profiles=max_profiles)
+    )
\ No newline at end of file
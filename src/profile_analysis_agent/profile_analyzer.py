@@ -1,10 +1,9 @@
+import ast
 import os
-from langchain.chat_models import ChatOpenAI
-from langchain.prompts import (
-    SystemMessagePromptTemplate,
-    HumanMessagePromptTemplate,
-    ChatPromptTemplate
-)
+from typing import List
+import httpx
+from langchain_openai import ChatOpenAI
+from langchain_core.messages import HumanMessage, SystemMessage
 from dotenv import load_dotenv
 
 load_dotenv('config.env')
@@ -21,22 +20,55 @@ You are a data parser. Given raw LinkedIn data, output a Python dict with keys:
 Only output a valid Python literal for the dict.
 """
 
-HUMAN_PROMPT = """
-Raw Data:
-{raw_data}
-"""
+# The system prompt has no template variables, so it is rendered exactly once
+# at import instead of re-walking a ChatPromptTemplate per call
+SYSTEM_MESSAGE = SystemMessage(content=SYSTEM_PROMPT)
+
+# Pooled transports pinned into the client: one TLS handshake with
+# api.openai.com per process, and HTTP/2 multiplexes the concurrent
+# abatch completions over that single connection
+_OPENAI_HTTP = httpx.Client(
+    http2=True,
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+    timeout=30.0,
+)
+_OPENAI_AHTTP = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+    timeout=30.0,
+)
 
-prompt = ChatPromptTemplate.from_messages([
-    SystemMessagePromptTemplate.from_template(SYSTEM_PROMPT),
-    HumanMessagePromptTemplate.from_template(HUMAN_PROMPT),
-])
+llm = ChatOpenAI(
+    model_name="gpt-4o",
+    temperature=0,
+    max_retries=2,
+    request_timeout=30,
+    http_client=_OPENAI_HTTP,
+    http_async_client=_OPENAI_AHTTP,
+)
 
-llm = ChatOpenAI(model_name="gpt-4o", temperature=0)
+def _build_messages(raw_data: dict) -> list:
+    """
+    Build the chat messages for one raw profile.
+    """
+    return [SYSTEM_MESSAGE, HumanMessage(content=f"Raw Data:\n{raw_data}")]
 
 def analyze_profile_data(raw_data: dict) -> dict:
     """
     Use the LLM to transform raw scraped data into the structured format.
     """
-    response = llm(prompt.format_prompt(raw_data=raw_data).to_messages())
-    result = eval(response.content)
+    response = llm.invoke(_build_messages(raw_data))
+    # literal_eval parses the dict literal without compiling arbitrary Python
+    result = ast.literal_eval(response.content)
     return result
+
+async def analyze_profiles_batch(raw_datas: List[dict], max_concurrency: int = 16) -> List[dict]:
+    """
+    Analyze many raw profiles in one concurrent wave via llm.abatch.
+
+    All N LLM round-trips overlap instead of running serially, bounded
+    by max_concurrency to stay within OpenAI tier limits.
+    """
+    prompts = [_build_messages(raw_data) for raw_data in raw_datas]
+    responses = await llm.abatch(prompts, config={"max_concurrency": max_concurrency})
+    return [ast.literal_eval(response.content) for response in responses]
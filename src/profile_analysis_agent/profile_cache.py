@@ -0,0 +1,86 @@
+import json
+import sqlite3
+import time
+from typing import Any, Dict, Optional
+
+# Default cache database and freshness window (LinkedIn profiles change
+# on the order of weeks, so 24h is conservative)
+CACHE_DB_PATH = ".profile_cache.db"
+DEFAULT_TTL = 86400
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS profile_cache (
+    normalized_url TEXT PRIMARY KEY,
+    summary JSON,
+    scraped_at INTEGER,
+    access_count INTEGER DEFAULT 0
+)
+"""
+
+_connection: Optional[sqlite3.Connection] = None
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a LinkedIn profile URL into the cache key.
+
+    Uses the same normalization as the crawler (strip query string and
+    trailing slash) plus lowercasing, so keys stay consistent.
+    """
+    return url.split("?")[0].rstrip("/").lower()
+
+def _get_connection() -> sqlite3.Connection:
+    """
+    Return the shared cache connection, creating the table on first use.
+    """
+    global _connection
+    if _connection is None:
+        _connection = sqlite3.connect(CACHE_DB_PATH, check_same_thread=False)
+        _connection.execute(_SCHEMA)
+        _connection.commit()
+    return _connection
+
+def get(norm_url: str, ttl: int = DEFAULT_TTL) -> Optional[Dict[str, Any]]:
+    """
+    Look up a cached profile summary.
+
+    Args:
+        norm_url (str): Normalized profile URL (see normalize_url).
+        ttl (int): Maximum age in seconds before an entry is considered stale.
+
+    Returns:
+        Optional[Dict[str, Any]]: The cached summary, or None on miss/stale.
+    """
+    conn = _get_connection()
+    row = conn.execute(
+        "SELECT summary, scraped_at FROM profile_cache WHERE normalized_url = ?",
+        (norm_url,)
+    ).fetchone()
+    if row is None:
+        return None
+
+    summary_json, scraped_at = row
+    if time.time() - scraped_at > ttl:
+        return None
+
+    conn.execute(
+        "UPDATE profile_cache SET access_count = access_count + 1 WHERE normalized_url = ?",
+        (norm_url,)
+    )
+    conn.commit()
+    return json.loads(summary_json)
+
+def put(norm_url: str, summary: Dict[str, Any]) -> None:
+    """
+    Store a profile summary in the cache.
+
+    Args:
+        norm_url (str): Normalized profile URL (see normalize_url).
+        summary (Dict[str, Any]): The structured summary to cache.
+    """
+    conn = _get_connection()
+    conn.execute(
+        "INSERT OR REPLACE INTO profile_cache "
+        "(normalized_url, summary, scraped_at, access_count) VALUES (?, ?, ?, 0)",
+        (norm_url, json.dumps(summary), int(time.time()))
+    )
+    conn.commit()
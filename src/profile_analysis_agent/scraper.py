@@ -1,10 +1,43 @@
 import re
-import time
-from typing import Dict, Any
+import threading
+from functools import lru_cache
+from typing import Dict, Any, Optional
+import httpx
+from lxml import html as lxml_html
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
+
+# File where the LinkedIn auth cookie from the one-time login is persisted
+LI_AT_COOKIE_FILE = ".li_at_cookie"
+
+# Compiled once at import instead of per extract call
+_LINKEDIN_URL_RE = re.compile(r"^https://(www\.)?linkedin\.com/in/[A-Za-z0-9\-_%]+/?$")
+
+
+@lru_cache(maxsize=4096)
+def _is_valid_profile_url(url: str) -> bool:
+    """
+    Whether url is a well-formed LinkedIn profile URL (cached per URL).
+    """
+    return _LINKEDIN_URL_RE.match(url) is not None
+
+_HTTP_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    )
+}
+
+# Shared HTTP client, created lazily after the auth cookie is available.
+# The lock serializes the cold-start bootstrap: without it, concurrent
+# summary workers would each see None and launch their own Selenium login
+# against the same account
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
 
 def load_credentials(env_path: str = "config.env") -> Dict[str, str]:
     """
@@ -16,57 +49,109 @@ def load_credentials(env_path: str = "config.env") -> Dict[str, str]:
         raise ValueError("config.env must contain at least two lines")
     return {"username": lines[0].strip(), "password": lines[1].strip()}
 
-def extract_linkedin_profile_data(url: str) -> Dict[str, Any]:
+def _selenium_login() -> webdriver.Chrome:
     """
-    Scrape basic profile fields from a LinkedIn profile.
+    Start a headless Chrome and log into LinkedIn. Caller owns the driver.
     """
-    # Validate URL
-    if not re.match(r"^https://(www\.)?linkedin\.com/in/[A-Za-z0-9\-_%]+/?$", url):
-        raise ValueError(f"Invalid LinkedIn profile URL: {url}")
-
     creds = load_credentials()
     options = webdriver.ChromeOptions()
     options.add_argument("--headless")
     driver = webdriver.Chrome(
         service=Service(ChromeDriverManager().install()), options=options
     )
-
-    # Login if credentials provided
     driver.get("https://www.linkedin.com/login")
-    time.sleep(2)
+    WebDriverWait(driver, 10).until(
+        EC.presence_of_element_located((By.ID, "username"))
+    )
     driver.find_element("id", "username").send_keys(creds["username"])
     driver.find_element("id", "password").send_keys(creds["password"])
     driver.find_element("xpath", '//button[@type="submit"]').click()
-    time.sleep(2)
+    # Login is complete once the global search bar renders
+    WebDriverWait(driver, 10).until(
+        EC.presence_of_element_located(
+            (By.CSS_SELECTOR, "input.search-global-typeahead__input")
+        )
+    )
+    return driver
+
+def _get_li_at_cookie() -> str:
+    """
+    Return the LinkedIn `li_at` session cookie, logging in once via
+    Selenium and persisting the cookie so later runs skip the browser.
+    """
+    try:
+        with open(LI_AT_COOKIE_FILE, "r") as f:
+            cookie = f.read().strip()
+        if cookie:
+            return cookie
+    except FileNotFoundError:
+        pass
+
+    driver = _selenium_login()
+    try:
+        cookie_data = driver.get_cookie("li_at")
+    finally:
+        driver.quit()
+    if not cookie_data:
+        raise ValueError("LinkedIn login did not yield an li_at cookie")
 
-    # Fetch profile page
-    driver.get(url)
-    time.sleep(3)
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-    driver.quit()
+    cookie = cookie_data["value"]
+    with open(LI_AT_COOKIE_FILE, "w") as f:
+        f.write(cookie)
+    return cookie
+
+def _get_http_client() -> httpx.Client:
+    """
+    Return the shared authenticated HTTP client, creating it on first use.
+
+    Double-checked locking so only the first caller pays the cookie
+    bootstrap (possibly a full Selenium login) while concurrent workers
+    wait for the one shared client instead of racing to build their own.
+    """
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = httpx.Client(
+                    http2=True,
+                    headers=_HTTP_HEADERS,
+                    cookies={"li_at": _get_li_at_cookie()},
+                    follow_redirects=True,
+                    timeout=15.0,
+                )
+    return _http_client
+
+def _parse_profile_fields(page_source: str) -> Dict[str, Any]:
+    """
+    Pull the raw profile fields out of a LinkedIn profile page.
+    """
+    tree = lxml_html.fromstring(page_source)
 
     # Parse name
-    name_tag = soup.select_one("h1.text-heading-xlarge")
-    if not name_tag:
+    name_nodes = tree.xpath('//h1[contains(@class, "text-heading-xlarge")]')
+    if not name_nodes:
         raise ValueError("Failed to parse name")
-    name = name_tag.get_text(strip=True)
+    name = name_nodes[0].text_content().strip()
 
     # Parse skills
-    skills = [el.get_text(strip=True) for el in soup.select(".pv-skill-category-entity__name-text")]
+    skills = [
+        el.text_content().strip()
+        for el in tree.xpath('//*[contains(@class, "pv-skill-category-entity__name-text")]')
+    ]
 
     # Parse years of experience
-    exp_match = soup.find(text=re.compile(r"\d+\+?\s+years"))
-    exp_text = exp_match.strip() if exp_match else "0 years"
+    exp_match = re.search(r"\d+\+?\s+years", page_source)
+    exp_text = exp_match.group(0) if exp_match else "0 years"
 
     # Parse education
     edu_entries = []
-    for edu in soup.select(".pv-education-entity"):
-        school = edu.select_one("h3.pv-entity__school-name")
-        degree = edu.select_one(".pv-entity__degree-name .t-14")
+    for edu in tree.xpath('//*[contains(@class, "pv-education-entity")]'):
+        school = edu.xpath('.//h3[contains(@class, "pv-entity__school-name")]')
+        degree = edu.xpath('.//*[contains(@class, "pv-entity__degree-name")]//*[contains(@class, "t-14")]')
         if school:
             edu_entries.append({
-                "school": school.get_text(strip=True),
-                "degree": degree.get_text(strip=True) if degree else ""
+                "school": school[0].text_content().strip(),
+                "degree": degree[0].text_content().strip() if degree else ""
             })
 
     return {
@@ -75,3 +160,95 @@ def extract_linkedin_profile_data(url: str) -> Dict[str, Any]:
         "raw_experience": exp_text,
         "raw_education": edu_entries
     }
+
+def _extract_with_http(url: str) -> Dict[str, Any]:
+    """
+    Fast path: fetch the profile over plain HTTP with the saved auth cookie.
+    No browser startup, no JS rendering, no fixed sleeps.
+    """
+    client = _get_http_client()
+    response = client.get(url)
+    response.raise_for_status()
+    if "authwall" in str(response.url) or "/login" in str(response.url):
+        raise ValueError("LinkedIn auth cookie rejected, login required")
+    return _parse_profile_fields(response.text)
+
+class LinkedInSession:
+    """
+    Reusable Selenium session: log in once, serve many profile fetches.
+
+    The browser is started lazily on the first fetch, so pipelines where
+    the HTTP fast path succeeds for every profile never pay the
+    ChromeDriver startup and login cost at all. Fetches are serialized
+    with a lock since a WebDriver is not safe for concurrent use.
+    """
+
+    def __init__(self):
+        self._driver: Optional[webdriver.Chrome] = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "LinkedInSession":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Shut down the browser if it was ever started.
+        """
+        if self._driver is not None:
+            self._driver.quit()
+            self._driver = None
+
+    def fetch(self, url: str) -> str:
+        """
+        Load a profile page in the logged-in browser and return its HTML.
+        """
+        with self._lock:
+            if self._driver is None:
+                self._driver = _selenium_login()
+            self._driver.get(url)
+            # Proceed the instant the name header (what we parse) is in the DOM
+            WebDriverWait(self._driver, 10).until(
+                EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, "h1.text-heading-xlarge")
+                )
+            )
+            return self._driver.page_source
+
+def _extract_with_selenium(url: str, session: Optional[LinkedInSession] = None) -> Dict[str, Any]:
+    """
+    Fallback path: render the profile in a headless browser.
+
+    Reuses the caller's LinkedInSession when given one; otherwise spins
+    up (and tears down) a one-shot session.
+    """
+    if session is not None:
+        page_source = session.fetch(url)
+    else:
+        with LinkedInSession() as one_shot:
+            page_source = one_shot.fetch(url)
+    return _parse_profile_fields(page_source)
+
+def extract_linkedin_profile_data(url: str, session: Optional[LinkedInSession] = None) -> Dict[str, Any]:
+    """
+    Scrape basic profile fields from a LinkedIn profile.
+
+    Tries the HTTP+lxml fast path first and only falls back to a full
+    Selenium session when the plain request cannot be parsed.
+
+    Args:
+        url (str): LinkedIn profile URL.
+        session (Optional[LinkedInSession]): Logged-in browser session to
+            reuse for the fallback; avoids a fresh Chrome + login per profile.
+    """
+    # Validate URL
+    if not _is_valid_profile_url(url):
+        raise ValueError(f"Invalid LinkedIn profile URL: {url}")
+
+    try:
+        return _extract_with_http(url)
+    except Exception as e:
+        print(f"HTTP fast path failed for {url}: {str(e)}, falling back to Selenium")
+        return _extract_with_selenium(url, session=session)
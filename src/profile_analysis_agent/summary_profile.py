@@ -1,9 +1,27 @@
-from scraper import extract_linkedin_profile_data
+from typing import Optional
+
+from scraper import extract_linkedin_profile_data, LinkedInSession
 from profile_analyzer import analyze_profile_data
+import profile_cache
 
-def get_linkedin_profile_summary(url: str) -> dict:
+def get_linkedin_profile_summary(
+    url: str,
+    session: Optional[LinkedInSession] = None,
+    ttl: int = profile_cache.DEFAULT_TTL
+) -> dict:
     """
     Full pipeline: scrape, analyze, return structured dict.
+
+    Results are cached by normalized URL so repeated runs skip both the
+    scrape and the LLM call for profiles seen within the TTL. Passing a
+    LinkedInSession lets many profiles share one logged-in browser.
     """
-    raw = extract_linkedin_profile_data(url)
-    return analyze_profile_data(raw)
\ No newline at end of file
+    norm_url = profile_cache.normalize_url(url)
+    cached = profile_cache.get(norm_url, ttl=ttl)
+    if cached is not None:
+        return cached
+
+    raw = extract_linkedin_profile_data(url, session=session)
+    summary = analyze_profile_data(raw)
+    profile_cache.put(norm_url, summary)
+    return summary